@@ -0,0 +1,73 @@
+"""
+Pre-render the splash screen image shipped as gui/icons/splash.png.
+
+Drawing the splash with QPainter at every launch costs several font
+constructions and text-shaping passes on a cold start, so the image is
+rendered once here and loaded as a plain pixmap by main.py.
+Re-run this script whenever the splash design changes.
+"""
+
+import os
+import sys
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor, QFont, QGuiApplication, QPainter, QPixmap
+
+SPLASH_PATH = os.path.join("gui", "icons", "splash.png")
+
+
+def render_splash_pixmap():
+    """Draw the splash screen contents into a QPixmap"""
+    # Create a custom splash screen with gradient background
+    splash_pixmap = QPixmap(400, 300)
+    splash_pixmap.fill(QColor(214, 240, 250))  # Light blue background
+
+    # Create painter for custom drawing
+    painter = QPainter(splash_pixmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+    # Draw gradient background
+    gradient = QColor(178, 224, 247)  # Lighter blue
+    painter.fillRect(0, 0, 400, 300, gradient)
+
+    # Draw title
+    title_font = QFont("Arial", 24, QFont.Weight.Bold)
+    painter.setFont(title_font)
+    painter.setPen(QColor(0, 0, 0))
+    painter.drawText(0, 80, 400, 40, Qt.AlignmentFlag.AlignCenter, "PDF Utilities")
+
+    # Draw subtitle - Updated to highlight key features
+    subtitle_font = QFont("Arial", 11)
+    painter.setFont(subtitle_font)
+    painter.setPen(QColor(100, 100, 100))
+    painter.drawText(0, 120, 400, 30, Qt.AlignmentFlag.AlignCenter, "Convert • Compress • Merge • Split • Extract")
+
+    # Draw version
+    version_font = QFont("Arial", 10)
+    painter.setFont(version_font)
+    painter.setPen(QColor(150, 150, 150))
+    painter.drawText(0, 150, 400, 20, Qt.AlignmentFlag.AlignCenter, "All-in-One PDF Solution")
+
+    # Draw loading text
+    loading_font = QFont("Arial", 11)
+    painter.setFont(loading_font)
+    painter.setPen(QColor(80, 80, 80))
+    painter.drawText(0, 200, 400, 30, Qt.AlignmentFlag.AlignCenter, "Initializing...")
+
+    painter.end()
+
+    return splash_pixmap
+
+
+def bake_splash(output_path=SPLASH_PATH):
+    """Render the splash screen and save it as a PNG"""
+    if not render_splash_pixmap().save(output_path, "PNG"):
+        print(f"Failed to save splash image: {output_path}")
+        return False
+    print(f"Splash image created: {output_path}")
+    return True
+
+
+if __name__ == "__main__":
+    app = QGuiApplication(sys.argv)
+    sys.exit(0 if bake_splash() else 1)
@@ -2,6 +2,8 @@ import os
 import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 
 import fitz  # PyMuPDF
 
@@ -190,8 +192,13 @@ def get_system_ghostscript_path():
     return None
 
 
+@lru_cache(maxsize=1)
 def is_ghostscript_available():
-    """Check if Ghostscript is available (system installation on all platforms)."""
+    """Check if Ghostscript is available (system installation on all platforms).
+
+    The result is cached for the session; call is_ghostscript_available.cache_clear()
+    after installing Ghostscript to look it up again.
+    """
     if os.name == "nt":
         return shutil.which("gswin64c") is not None or shutil.which("gswin32c") is not None
     else:
@@ -271,12 +278,20 @@ def ghostscript_compress(input_path, output_path, quality="medium", image_qualit
 
 
 def compress_multiple_pdfs(
-    pdf_files, output_directory, compression_mode="medium", target_size_kb=None, progress_callback=None, status_callback=None
+    pdf_files,
+    output_directory,
+    compression_mode="medium",
+    target_size_kb=None,
+    progress_callback=None,
+    status_callback=None,
+    is_running=None,
 ):
     """
     Compress multiple PDFs using Ghostscript. compression_mode: 'low', 'medium', 'high'.
     target_size_kb: if set, will compress to target size using image quality adjustment.
     Output files are named with _compressed before .pdf, and numbered if needed.
+    Files are compressed in parallel; callbacks may be called from pool threads.
+    is_running: if given, returns False once the batch should stop; files not yet started are skipped.
     """
     if not is_ghostscript_available():
         if os.name == "nt":
@@ -299,12 +314,14 @@ def compress_multiple_pdfs(
             status_callback(msg)
         return [], [msg]
 
-    if not os.path.exists(output_directory):
-        os.makedirs(output_directory)
+    os.makedirs(output_directory, exist_ok=True)
 
     total = len(pdf_files)
     successes, failures = [], []
 
+    # Claim every output name up front so files compressed side by side never pick the same one
+    jobs = []
+    claimed = set()
     for idx, pdf in enumerate(pdf_files):
         base = os.path.basename(pdf)
         name, ext = os.path.splitext(base)
@@ -313,11 +330,17 @@ def compress_multiple_pdfs(
 
         # Ensure unique file name
         counter = 1
-        while os.path.exists(out_path):
+        while out_path in claimed or os.path.exists(out_path):
             out_base = f"{name}_compressed({counter}){ext}"
             out_path = os.path.join(output_directory, out_base)
             counter += 1
+        claimed.add(out_path)
+        jobs.append((idx, pdf, base, out_path))
 
+    def compress_one(idx, pdf, base, out_path):
+        """Compress one file; returns (success message, failure message) with the other one None, or None if skipped"""
+        if is_running and not is_running():
+            return None
         if status_callback:
             status_callback(f"Compressing {base} ({idx+1}/{total})...")
 
@@ -327,28 +350,47 @@ def compress_multiple_pdfs(
                 if status_callback:
                     status_callback(f"Compressing to target size: {target_size_kb} KB...")
                 success, message = compress_pdf_to_target_size(pdf, out_path, target_size_kb)
-                if success:
-                    successes.append(f"Compressed: {base} - {message}")
-                else:
-                    # Check if it's a complete failure or just target size not achieved
-                    if "Failed to compress file" in message:
-                        failures.append(f"Failed to compress {base}: {message}")
-                    else:
-                        # Target size not achieved but file was compressed
-                        successes.append(f"Compressed: {base} - {message}")
+                # Check if it's a complete failure or just target size not achieved
+                if not success and "Failed to compress file" in message:
+                    return None, f"Failed to compress {base}: {message}"
+                # Target size achieved, or not achieved but the file was compressed
+                return f"Compressed: {base} - {message}", None
             else:
                 # If no target size, use specified compression mode
                 ghostscript_compress(pdf, out_path, quality=compression_mode)
-                successes.append(f"Compressed: {base}")
-
-            if progress_callback:
-                progress_callback(idx + 1, total)
+                return f"Compressed: {base}", None
 
         except Exception as e:
             error_msg = f"Error compressing {base}: {str(e)}"
             print(f"[ERROR] {error_msg}")
-            failures.append(error_msg)
             if status_callback:
                 status_callback(error_msg)
+            return None, error_msg
+
+    # Each Ghostscript run is its own process, so a thread per file is enough to keep every core busy
+    results = [None] * total
+    with ThreadPoolExecutor(max_workers=min(total, os.cpu_count() or 1) or 1) as executor:
+        futures = {executor.submit(compress_one, *job): job[0] for job in jobs}
+        try:
+            for done, future in enumerate(as_completed(futures), 1):
+                if is_running and not is_running():
+                    break
+                results[futures[future]] = future.result()
+                if progress_callback:
+                    progress_callback(done, total)
+        finally:
+            # Files not yet started are dropped when stopping or on an unexpected failure
+            for future in futures:
+                future.cancel()
+
+    # Report in input order regardless of which file finished first
+    for result in results:
+        if result is None:
+            continue
+        success_msg, error_msg = result
+        if success_msg:
+            successes.append(success_msg)
+        else:
+            failures.append(error_msg)
 
     return successes, failures
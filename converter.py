@@ -1,4 +1,7 @@
+import multiprocessing
 import os
+from concurrent.futures import ProcessPoolExecutor, as_completed, wait
+from concurrent.futures.process import BrokenProcessPool
 
 from pdf2docx import Converter  # Assuming you use pdf2docx
 
@@ -20,7 +23,15 @@ def convert_single_pdf_to_docx(pdf_path, docx_path):
         return False, f"Error converting {os.path.basename(pdf_path)}: {str(e)}"
 
 
-def convert_multiple_pdfs_to_docx(pdf_files, output_directory, progress_callback=None, status_callback=None):
+def convert_multiple_pdfs_to_docx(
+    pdf_files,
+    output_directory,
+    progress_callback=None,
+    status_callback=None,
+    is_running=None,
+    executor=None,
+    replace_executor=None,
+):
     """
     Converts a list of PDF files to DOCX format, saving them in the output_directory.
 
@@ -33,6 +44,13 @@ def convert_multiple_pdfs_to_docx(pdf_files, output_directory, progress_callback
         status_callback (function, optional):
             A function to call for status messages.
             Expected to take (message_string).
+        is_running (function, optional):
+            Returns False once the batch should stop; files not yet started are skipped.
+        executor (ProcessPoolExecutor, optional):
+            A long-lived process pool to convert several files on; by default one is started for this batch.
+        replace_executor (function, optional):
+            Called with executor once it raises BrokenProcessPool; returns a fresh pool on which the files not yet
+            converted are retried once.
     Returns:
         tuple: (list_of_successful_conversion_messages, list_of_failed_conversion_messages)
     """
@@ -41,13 +59,12 @@ def convert_multiple_pdfs_to_docx(pdf_files, output_directory, progress_callback
             status_callback("No PDF files selected for conversion.")
         return [], []
 
-    if not os.path.exists(output_directory):
-        try:
-            os.makedirs(output_directory)
-        except OSError as e:
-            if status_callback:
-                status_callback(f"Error creating output directory {output_directory}: {e}")
-            return [], [f"Error creating output directory {output_directory}: {e}"]  # Or handle differently
+    try:
+        os.makedirs(output_directory, exist_ok=True)
+    except OSError as e:
+        if status_callback:
+            status_callback(f"Error creating output directory {output_directory}: {e}")
+        return [], [f"Error creating output directory {output_directory}: {e}"]  # Or handle differently
 
     successful_messages = []
     failed_messages = []
@@ -56,27 +73,82 @@ def convert_multiple_pdfs_to_docx(pdf_files, output_directory, progress_callback
     if progress_callback:
         progress_callback(0, total_files)  # Initialize progress
 
-    for index, pdf_file in enumerate(pdf_files):
-        base_name = os.path.basename(pdf_file)
-        docx_name = os.path.splitext(base_name)[0] + ".docx"
-        docx_path = os.path.join(output_directory, docx_name)
-
+    # Claim every output name up front so inputs with the same name never write the same file side by side
+    jobs = []
+    claimed = set()
+    for pdf_file in pdf_files:
+        name = os.path.splitext(os.path.basename(pdf_file))[0]
+        docx_path = os.path.join(output_directory, name + ".docx")
+        counter = 1
+        while docx_path in claimed:
+            docx_path = os.path.join(output_directory, f"{name}({counter}).docx")
+            counter += 1
+        claimed.add(docx_path)
+        jobs.append((pdf_file, docx_path))
+
+    results = [None] * total_files
+    if total_files == 1:
+        pdf_file, docx_path = jobs[0]
         if status_callback:
-            status_callback(f"Converting {base_name} ({index + 1}/{total_files})...")
-
-        success, message = convert_single_pdf_to_docx(pdf_file, docx_path)
-
+            status_callback(f"Converting {os.path.basename(pdf_file)} (1/1)...")
+        results[0] = convert_single_pdf_to_docx(pdf_file, docx_path)
+        if status_callback:
+            status_callback(results[0][1])
+        if progress_callback:
+            progress_callback(1, total_files)
+    else:
+        # Layout analysis runs in Python and holds the GIL, so files are converted in separate processes; spawned
+        # rather than forked, since the calling process runs Qt and other worker threads
+        if status_callback:
+            status_callback(f"Converting {total_files} files...")
+        own_executor = executor is None
+        if own_executor:
+            executor = ProcessPoolExecutor(
+                max_workers=min(total_files, os.cpu_count() or 1), mp_context=multiprocessing.get_context("spawn")
+            )
+        pending = range(total_files)
+        done = 0
+        try:
+            for attempt in range(2):
+                futures = {}
+                try:
+                    for index in pending:
+                        futures[executor.submit(convert_single_pdf_to_docx, *jobs[index])] = index
+                    for future in as_completed(futures):
+                        if is_running and not is_running():
+                            break
+                        results[futures[future]] = future.result()
+                        if status_callback:  # Update status after each attempt
+                            status_callback(results[futures[future]][1])
+                        done += 1
+                        if progress_callback:
+                            progress_callback(done, total_files)
+                    break
+                except BrokenProcessPool:
+                    # A child died and the pool rejects all further work; files already converted keep their results
+                    if attempt or replace_executor is None:
+                        raise
+                    executor = replace_executor(executor)
+                    pending = [index for index in pending if results[index] is None]
+                finally:
+                    # Files not yet started are dropped when stopping or on an unexpected failure
+                    for future in futures:
+                        future.cancel()
+                    wait(futures)
+        finally:
+            if own_executor:
+                executor.shutdown()
+
+    # Report in input order regardless of which file finished first
+    for result in results:
+        if result is None:
+            continue
+        success, message = result
         if success:
             successful_messages.append(message)
         else:
             failed_messages.append(message)
 
-        if status_callback:  # Update status after each attempt
-            status_callback(message)
-
-        if progress_callback:
-            progress_callback(index + 1, total_files)
-
     final_status = f"Conversion finished. {len(successful_messages)} succeeded, {len(failed_messages)} failed."
     if status_callback:
         status_callback(final_status)
@@ -24,7 +24,7 @@ class BaseTab(QWidget):
         # Store a reference to the main window's notification method
         self.show_notification = getattr(parent, "show_notification", self._fallback_notification)
 
-    def _fallback_notification(self, message: str, level: str = "info", duration: int = 4000):
+    def _fallback_notification(self, message: str, level: str = "info", duration: int = 4000, correlation_id: str = None):
         """A fallback in case the notification method isn't available."""
         print(f"[{level.upper()}] Notification: {message}")
 
@@ -87,6 +87,25 @@ class NotificationWidget(QFrame):
         # Set timer to hide
         self.hide_timer.start(duration)
 
+    def update_message(self, message: str, duration: int = 6000):
+        """
+        Replace the text of the visible notification without fading it in again.
+        The hide timer restarts so the notification stays up for another duration.
+        """
+        self.message_label.setText(message)
+        self.adjustSize()
+        self._reposition()
+        self.hide_timer.start(duration)
+
+    def is_showing(self) -> bool:
+        """Return True if the notification is visible and not fading out."""
+        return self.isVisible() and not self.hiding
+
+    def reposition(self):
+        """Re-center on the parent if the notification is visible."""
+        if self.isVisible():
+            self._reposition()
+
     def _reposition(self):
         """Move notification to the center of the parent."""
         parent_rect = self.parent.rect()
@@ -115,7 +134,6 @@ class NotificationWidget(QFrame):
             self.hiding = False
 
     def resizeEvent(self, event):
-        """Handle parent resize events to stay centered."""
+        """Stay centered when the notification itself is resized."""
         super().resizeEvent(event)
-        if self.isVisible():
-            self._reposition() 
\ No newline at end of file
+        self.reposition()
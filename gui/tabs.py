@@ -3,6 +3,7 @@ import os
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QKeySequence, QShortcut
 from PyQt6.QtWidgets import (
+    QCheckBox,
     QComboBox,
     QHBoxLayout,
     QLabel,
@@ -51,10 +52,10 @@ class ConvertTab(BaseTab):
 
         # Create and start worker
         self.worker = ConversionWorker(pdf_files, output_dir, parent=self)
-        self.worker.progress.connect(self._update_progress)
-        self.worker.status_update.connect(self.show_notification)  # Connect directly
-        self.worker.finished.connect(self._handle_conversion_finished)
-        self.worker.error.connect(self._handle_conversion_error)
+        self.worker.signals.progress.connect(self._update_progress)
+        self.worker.signals.status_update.connect(self._update_status)
+        self.worker.signals.finished.connect(self._handle_conversion_finished)
+        self.worker.signals.error.connect(self._handle_conversion_error)
         self.worker.start()
 
         # Update UI
@@ -69,7 +70,7 @@ class ConvertTab(BaseTab):
 
     def _update_status(self, message):
         """Update status label"""
-        self.show_notification(message, "info")
+        self.show_notification(message, "info", correlation_id="batch_convert")
 
     def _handle_conversion_finished(self, successful_messages, failed_messages):
         """Handle conversion completion"""
@@ -93,7 +94,8 @@ class ConvertTab(BaseTab):
         """Stop any active conversion process"""
         if self.worker and self.worker.isRunning():
             self.worker.stop()
-            self.worker.wait()
+            # Files already running in pool processes can't be interrupted; don't hold the GUI until they finish
+            self.worker.wait(2)
             self.start_btn.setEnabled(True)
             self.progress_bar.setVisible(False)
             self.show_notification("Conversion stopped.", "info")
@@ -204,10 +206,10 @@ class CompressTab(BaseTab):
         self.worker = CompressionWorker(
             pdf_files, output_dir, compression_mode=compression_mode, target_size_kb=target_size_kb, parent=self
         )
-        self.worker.progress.connect(self._update_progress)
-        self.worker.status_update.connect(self.show_notification)
-        self.worker.finished.connect(self._handle_compression_finished)
-        self.worker.error.connect(self._handle_compression_error)
+        self.worker.signals.progress.connect(self._update_progress)
+        self.worker.signals.status_update.connect(self._update_status)
+        self.worker.signals.finished.connect(self._handle_compression_finished)
+        self.worker.signals.error.connect(self._handle_compression_error)
         self.worker.start()
 
         # Update UI
@@ -223,7 +225,7 @@ class CompressTab(BaseTab):
 
     def _update_status(self, message):
         """Update status label"""
-        self.show_notification(message, "info")
+        self.show_notification(message, "info", correlation_id="batch_compress")
         # Track generated files from status messages
         if "Saved compressed file:" in message:
             file_path = message.split("Saved compressed file:")[1].strip()
@@ -354,10 +356,10 @@ class MergeTab(BaseTab):
 
         # Create and start worker
         self.worker = MergeWorker(pdf_files, output_filename, parent=self)
-        self.worker.progress.connect(self._update_progress)
-        self.worker.status_update.connect(self.show_notification)
-        self.worker.finished.connect(self._handle_merge_finished)
-        self.worker.error.connect(self._handle_merge_error)
+        self.worker.signals.progress.connect(self._update_progress)
+        self.worker.signals.status_update.connect(self._update_status)
+        self.worker.signals.finished.connect(self._handle_merge_finished)
+        self.worker.signals.error.connect(self._handle_merge_error)
         self.worker.start()
 
         # Update UI
@@ -372,7 +374,7 @@ class MergeTab(BaseTab):
 
     def _update_status(self, message):
         """Update status label"""
-        self.show_notification(message, "info")
+        self.show_notification(message, "info", correlation_id="batch_merge")
 
     def _handle_merge_finished(self, success):
         """Handle merge completion"""
@@ -437,6 +439,11 @@ class SplitTab(BaseTab):
         )
         mode_layout.addWidget(range_label)
         mode_layout.addWidget(self.range_input)
+
+        # Write each run of consecutive pages to one file instead of one file per page
+        self.group_ranges_check = QCheckBox("One file per range")
+        self.group_ranges_check.setStyleSheet("color: #000;")
+        mode_layout.addWidget(self.group_ranges_check)
         mode_layout.addStretch()
 
         # Add the combined layout
@@ -448,6 +455,7 @@ class SplitTab(BaseTab):
         # Initially hide range input
         range_label.setVisible(False)
         self.range_input.setVisible(False)
+        self.group_ranges_check.setVisible(False)
 
     def _on_split_mode_changed(self, mode):
         """Show/hide range input based on selected mode"""
@@ -459,6 +467,7 @@ class SplitTab(BaseTab):
         for widget in self.findChildren(QLineEdit):
             if widget.placeholderText() == "e.g., 1,3,5-7,9":
                 widget.setVisible(is_custom_range)
+        self.group_ranges_check.setVisible(is_custom_range)
 
     def _parse_page_ranges(self, range_str):
         """Parse comma-separated page ranges into a list of page numbers"""
@@ -510,12 +519,17 @@ class SplitTab(BaseTab):
 
         # Create and start worker
         self.worker = SplitWorker(
-            pdf_files=pdf_files, output_directory=output_dir, split_mode=split_mode, page_ranges=page_ranges, parent=self
+            pdf_files=pdf_files,
+            output_directory=output_dir,
+            split_mode=split_mode,
+            page_ranges=page_ranges,
+            group_ranges=self.group_ranges_check.isChecked(),
+            parent=self,
         )
-        self.worker.progress.connect(self._update_progress)
-        self.worker.status_update.connect(self.show_notification)
-        self.worker.finished.connect(self._handle_split_finished)
-        self.worker.error.connect(self._handle_split_error)
+        self.worker.signals.progress.connect(self._update_progress)
+        self.worker.signals.status_update.connect(self._update_status)
+        self.worker.signals.finished.connect(self._handle_split_finished)
+        self.worker.signals.error.connect(self._handle_split_error)
         self.worker.start()
 
         # Update UI
@@ -530,7 +544,7 @@ class SplitTab(BaseTab):
 
     def _update_status(self, message):
         """Update status label"""
-        self.show_notification(message, "info")
+        self.show_notification(message, "info", correlation_id="batch_split")
 
     def _handle_split_finished(self, success):
         """Handle split completion"""
@@ -673,10 +687,10 @@ class ExtractTab(BaseTab):
             page_ranges=page_ranges,
             parent=self,
         )
-        self.worker.progress.connect(self._update_progress)
-        self.worker.status_update.connect(self.show_notification)
-        self.worker.finished.connect(self._handle_extract_finished)
-        self.worker.error.connect(self._handle_extract_error)
+        self.worker.signals.progress.connect(self._update_progress)
+        self.worker.signals.status_update.connect(self._update_status)
+        self.worker.signals.finished.connect(self._handle_extract_finished)
+        self.worker.signals.error.connect(self._handle_extract_error)
         self.worker.start()
 
         # Update UI
@@ -691,7 +705,7 @@ class ExtractTab(BaseTab):
 
     def _update_status(self, message):
         """Update status label"""
-        self.show_notification(message, "info")
+        self.show_notification(message, "info", correlation_id="batch_extract")
 
     def _handle_extract_finished(self, success):
         """Handle extraction completion"""
@@ -822,10 +836,10 @@ class ConvertToImageTab(BaseTab):
             color_type=color_type,
             parent=self,
         )
-        self.worker.progress.connect(self._update_progress)
-        self.worker.status_update.connect(self.show_notification)
-        self.worker.finished.connect(self._handle_conversion_finished)
-        self.worker.error.connect(self._handle_conversion_error)
+        self.worker.signals.progress.connect(self._update_progress)
+        self.worker.signals.status_update.connect(self._update_status)
+        self.worker.signals.finished.connect(self._handle_conversion_finished)
+        self.worker.signals.error.connect(self._handle_conversion_error)
         self.worker.start()
 
         # Update UI
@@ -840,7 +854,7 @@ class ConvertToImageTab(BaseTab):
 
     def _update_status(self, message):
         """Update status label"""
-        self.show_notification(message, "info")
+        self.show_notification(message, "info", correlation_id="batch_convert_to_image")
 
     def _handle_conversion_finished(self, success):
         """Handle conversion completion"""
@@ -947,10 +961,10 @@ class ExtractTextTab(BaseTab):
             output_format=output_format,
             parent=self,
         )
-        self.worker.progress.connect(self._update_progress)
-        self.worker.status_update.connect(self.show_notification)
-        self.worker.finished.connect(self._handle_extraction_finished)
-        self.worker.error.connect(self._handle_extraction_error)
+        self.worker.signals.progress.connect(self._update_progress)
+        self.worker.signals.status_update.connect(self._update_status)
+        self.worker.signals.finished.connect(self._handle_extraction_finished)
+        self.worker.signals.error.connect(self._handle_extraction_error)
         self.worker.start()
 
         # Update UI
@@ -965,7 +979,7 @@ class ExtractTextTab(BaseTab):
 
     def _update_status(self, message):
         """Update status label"""
-        self.show_notification(message, "info")
+        self.show_notification(message, "info", correlation_id="batch_extract_text")
 
     def _handle_extraction_finished(self, success):
         """Handle extraction completion"""
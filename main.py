@@ -1,59 +1,219 @@
+import multiprocessing
 import os
+import re
 import sys
-from pathlib import Path
+import time
+from functools import lru_cache
 
-from PyQt6.QtCore import QSize, Qt, QThread, QTimer, pyqtSignal
-from PyQt6.QtGui import QAction, QColor, QFont, QIcon, QPainter, QPixmap
+from PyQt6.QtCore import QObject, QRunnable, QSize, Qt, QThread, QThreadPool, QTimer, pyqtSignal
+from PyQt6.QtGui import QAction, QColor, QIcon, QPixmap
 from PyQt6.QtWidgets import (
     QApplication,
     QFileDialog,
-    QFrame,
     QLabel,
     QMainWindow,
     QMenu,
     QMenuBar,
     QMessageBox,
+    QSizePolicy,
     QSplashScreen,
     QTabWidget,
-    QTabBar,
     QToolBar,
     QToolButton,
     QVBoxLayout,
     QWidget,
     QWidgetAction,
-    QProgressBar,
-    QSizePolicy,
 )
 
-from compressor import is_ghostscript_available
 from gui.notification import NotificationWidget
-from gui.tabs import (
-    CompressTab,
-    ConvertTab,
-    ConvertToImageTab,
-    ExtractTab,
-    MergeTab,
-    SplitTab,
-)
 from version import get_version
 
+# Window in which batch status notifications update one toast instead of showing a new one each
+TOAST_COALESCE_SECONDS = 2.0
+
+# Case-insensitive ".pdf" suffix test used when scanning folders
+_PDF_NAME = re.compile(r"\.pdf\Z", re.IGNORECASE)
+
+# (attribute name, gui.tabs class name, icon path, title, start button text, tab start method) in tab order
+# Tab classes are looked up by name so gui.tabs (and PyMuPDF/pdf2docx behind it) loads after the splash is up
+_TABS = (
+    ("convert_tab", "ConvertTab", "gui/icons/file-text.svg", "Convert to DOCX", "Convert", "_start_conversion_process"),
+    ("compress_tab", "CompressTab", "gui/icons/archive.svg", "Compress PDF", "Compress", "_start_compression"),
+    ("merge_tab", "MergeTab", "gui/icons/layers.svg", "Merge PDFs", "Merge", "_start_merge"),
+    ("split_tab", "SplitTab", "gui/icons/scissors.svg", "Split PDF", "Split", "_start_split"),
+    ("extract_tab", "ExtractTab", "gui/icons/file-text.svg", "Extract Text", "Extract", "_start_extract"),
+    (
+        "convert_to_image_tab",
+        "ConvertToImageTab",
+        "gui/icons/image.svg",
+        "Convert to Image",
+        "Convert",
+        "_start_convert_to_image",
+    ),
+)
+
+# (attribute name, icon path, text, handler method) for each toolbar button, left to right
+_TOOLBAR_BUTTONS = (
+    ("add_file_btn", "gui/icons/file-plus.svg", "Add File", "_add_file"),
+    ("add_folder_btn", "gui/icons/folder-plus.svg", "Add Folder", "_add_folder"),
+    ("delete_btn", "gui/icons/trash-2.svg", "Remove", "_delete_selected"),
+    ("clear_btn", "gui/icons/x-circle.svg", "Clear All", "_clear_all"),
+)
+
+# Stylesheet for the main window and everything in it, applied once before any child widget is created
+_STYLE = """
+    QMainWindow {
+        background: #b2e0f7;
+        spacing: 0px;
+        margin: 0px;
+        padding: 0px;
+    }
+    QMainWindow::separator {
+        background: #b2e0f7;
+        width: 0px;
+        height: 0px;
+    }
+    QWidget {
+        background: #d6f0fa;
+    }
+
+    QMenuBar {
+        background: #b2e0f7;
+        color: #000;
+        font-size: 15px;
+        spacing: 0px;
+        margin: 0px;
+        padding: 0px;
+        border: none;
+        border-bottom: none;
+    }
+    QMenuBar::item {
+        background: #b2e0f7;
+        color: #000;
+        spacing: 0px;
+        margin: 0px;
+        padding: 4px 8px;
+    }
+    QMenuBar::item:selected {
+        background: #a2d4ec;
+        color: #000;
+    }
+    QMenu {
+        background: #b2e0f7;
+        color: #000;
+        font-size: 15px;
+    }
+    QMenu::item {
+        background: #b2e0f7;
+        color: #000;
+        padding: 4px 8px;
+    }
+    QMenu::item:selected {
+        background: #a2d4ec;
+        color: #000;
+    }
+    QMenu::separator {
+        background: #a2d4ec;
+        height: 1px;
+        margin: 2px 4px;
+    }
+
+    QToolBar {
+        background: #b2e0f7;
+        color: #000;
+        spacing: 0px;
+        margin: 0px;
+        padding: 2px;
+        border: none;
+        border-top: 1px solid #8fc7e6;
+        border-bottom: none;
+    }
+    QToolBar QWidget {
+        background: #b2e0f7;
+    }
+    QToolBar QToolButton {
+        background: transparent;
+        color: #000;
+        font-size: 14px;
+        padding: 2px 8px;
+    }
+    QToolBar::separator {
+        background: #8fc7e6;
+        width: 2px;
+        margin: 0px;
+    }
+
+    QTabWidget {
+        background: #d6f0fa;
+        margin: 0px;
+        padding: 0px;
+    }
+    QTabWidget::pane {
+        border: 1px solid #b2e0f7;
+        background: #ffffff;
+        margin: 0px;
+        padding: 0px;
+    }
+    QTabBar {
+        background: #d6f0fa;
+        margin: 0px;
+        padding: 0px;
+        spacing: 0px;
+    }
+    QTabBar::tab {
+        background: #d6f0fa;
+        color: #000;
+        padding: 8px 16px;
+        border: 1px solid #b2e0f7;
+        border-bottom: none;
+    }
+    QTabBar::tab:selected {
+        background: #ffffff;
+        border-bottom: 1px solid #ffffff;
+        border-top: 1px solid #b2e0f7;
+    }
+    QTabBar::tab:hover {
+        background: #b7d6fb;
+    }
+    QTabBar::tab:selected:hover {
+        background: #ffffff;
+        border-bottom: 1px solid #b7d6fb;
+    }
+    QTabBar::scroller {
+        background: #d6f0fa;
+    }
+    QTabBar QToolButton {
+        background: #d6f0fa;
+    }
+
+    QLabel#loadingLabel {
+        font-size: 16px;
+        color: #666;
+        padding: 50px;
+    }
+"""
+
+
+# Base directory for bundled resources, resolved once since it can't change while running
+if getattr(sys, "frozen", False):
+    # Running as compiled executable
+    # One-file mode: PyInstaller extracts files to a temporary directory stored in _MEIPASS
+    # One-directory mode: files are in the same directory as the executable
+    _BASE_PATH = getattr(sys, "_MEIPASS", None) or os.path.dirname(sys.executable)
+else:
+    # Running as script
+    _BASE_PATH = os.path.dirname(os.path.abspath(__file__))
+
 
 def get_resource_path(relative_path):
     """Get absolute path to resource, works for dev and for PyInstaller"""
-    if getattr(sys, "frozen", False):
-        # Running as compiled executable
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        if hasattr(sys, "_MEIPASS"):
-            # One-file mode: files are extracted to a temporary directory
-            base_path = sys._MEIPASS
-        else:
-            # One-directory mode: files are in the same directory as the executable
-            base_path = os.path.dirname(sys.executable)
-    else:
-        # Running as script
-        base_path = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(_BASE_PATH, relative_path)
 
-    return os.path.join(base_path, relative_path)
+
+@lru_cache(maxsize=None)
+def _icon(relative_path):
+    """Load an icon once and share it between every widget that shows it"""
+    return QIcon(get_resource_path(relative_path))
 
 
 class InitializationThread(QThread):
@@ -64,99 +224,151 @@ class InitializationThread(QThread):
 
     def run(self):
         """Run initialization tasks"""
-        # Simulate initialization steps with feature-focused messages
-        self.progress_updated.emit("Loading PDF conversion engine...")
-        self.msleep(200)
+        # Pay the one-time import and library setup costs here, while the splash
+        # is visible, instead of on the first button click
+        try:
+            self.progress_updated.emit("Loading PDF conversion engine...")
+            import pdf2docx  # noqa: F401
 
-        self.progress_updated.emit("Initializing compression tools...")
-        self.msleep(300)
+            self.progress_updated.emit("Initializing compression tools...")
+            import fitz  # PyMuPDF
 
-        self.progress_updated.emit("Setting up merge & split functionality...")
-        self.msleep(250)
+            fitz.open().close()
 
-        self.progress_updated.emit("Preparing text extraction tools...")
-        self.msleep(200)
+            self.progress_updated.emit("Setting up merge & split functionality...")
+            from PIL import Image
 
-        self.progress_updated.emit("Ready to process your PDFs!")
-        self.msleep(100)
+            Image.init()  # Registers all image format plugins
 
-        self.initialization_complete.emit()
+            self.progress_updated.emit("Ready to process your PDFs!")
+        finally:
+            # Show the main window even if a warm-up step failed; the error resurfaces when that feature is used
+            self.initialization_complete.emit()
 
 
-class StretchableTabBar(QTabBar):
-    """Custom tab bar with a stretchable dummy tab at the end"""
-    
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.stretch_tab_index = -1
-        self._setup_stretch_tab()
-        
-    def _setup_stretch_tab(self):
-        """Add a stretchable dummy tab at the end"""
-        # Add a dummy tab that will stretch
-        self.stretch_tab_index = self.addTab("")
-        self.setTabEnabled(self.stretch_tab_index, False)
-        self.setTabTextColor(self.stretch_tab_index, QColor(0, 0, 0, 0))  # Transparent text
+class GhostscriptProbeSignals(QObject):
+    """Signals for GhostscriptProbe, since a QRunnable can't define its own"""
+
+    finished = pyqtSignal(bool)
+
+
+class GhostscriptProbe(QRunnable):
+    """Pool task that checks for Ghostscript off the GUI thread"""
+
+    def __init__(self):
+        super().__init__()
+        self.signals = GhostscriptProbeSignals()
+
+    def run(self):
+        """Look up Ghostscript and report whether it was found"""
+        from compressor import is_ghostscript_available
+
+        self.signals.finished.emit(is_ghostscript_available())
+
+
+class PDFConverterApp(QMainWindow):
+    # Help dialog contents; only the version is filled in at runtime
+    _ABOUT_TEMPLATE = """
+        <div style="color: black;">
+        <h2>PDF Utilities</h2>
+        <p><b>Version:</b> {version}</p>
+        <p><b>Description:</b> A comprehensive PDF processing application built with PyQt6.</p>
+        <p><b>Features:</b></p>
+        <ul>
+            <li>Convert PDF to DOCX</li>
+            <li>Compress PDF files</li>
+            <li>Merge multiple PDFs</li>
+            <li>Split PDF pages</li>
+            <li>Extract text from PDFs</li>
+            <li>Convert PDF to images</li>
+        </ul>
+        <p><b>License:</b> GNU Affero General Public License v3.0 (AGPL-3.0)</p>
+        <p><b>Dependencies:</b> PyQt6, PyMuPDF, pdf2docx, Pillow, Ghostscript</p>
+        </div>
+        """
+
+    _DOC_HTML = """
+        <div style="color: black;">
+        <h2>PDF Utilities Documentation</h2>
         
-    def tabSizeHint(self, index):
-        """Override to make the stretch tab expand to fill remaining space"""
-        if index == self.stretch_tab_index:
-            # Calculate the total width of all real tabs
-            real_tabs_width = 0
-            for i in range(self.count()):
-                if i != self.stretch_tab_index:
-                    real_tabs_width += super().tabSizeHint(i).width()
-            
-            # Get the available width for the tab bar
-            available_width = self.width()
-            
-            # Calculate the stretch tab width to fill remaining space
-            stretch_width = max(0, available_width - real_tabs_width)
-            return QSize(stretch_width, super().tabSizeHint(index).height())
-        else:
-            return super().tabSizeHint(index)
-    
-    def resizeEvent(self, event):
-        """Handle resize events to update stretch tab size"""
-        super().resizeEvent(event)
-        # Force a repaint to update the stretch tab size
-        self.update()
+        <h3>Quick Start Guide</h3>
+        <p><b>1. Add Files:</b> Use "Add File" or "Add Folder" to select PDF files</p>
+        <p><b>2. Choose Operation:</b> Select the appropriate tab for your task</p>
+        <p><b>3. Configure Settings:</b> Adjust options as needed</p>
+        <p><b>4. Select Output:</b> Choose where to save results</p>
+        <p><b>5. Start Processing:</b> Click the action button</p>
         
-    def mousePressEvent(self, event):
-        """Prevent clicking on the stretch tab"""
-        tab_index = self.tabAt(event.pos())
-        if tab_index == self.stretch_tab_index:
-            return  # Ignore clicks on stretch tab
-        super().mousePressEvent(event)
+        <h3>Features</h3>
+        <p><b>Convert to DOCX:</b> Convert PDF files to editable Word documents</p>
+        <p><b>Compress PDF:</b> Reduce file size with quality options</p>
+        <p><b>Merge PDFs:</b> Combine multiple PDFs into one file</p>
+        <p><b>Split PDF:</b> Extract specific pages or ranges</p>
+        <p><b>Extract Text:</b> Pull text content from PDFs</p>
+        <p><b>Convert to Image:</b> Export PDF pages as images</p>
         
-    def mouseDoubleClickEvent(self, event):
-        """Prevent double-clicking on the stretch tab"""
-        tab_index = self.tabAt(event.pos())
-        if tab_index == self.stretch_tab_index:
-            return  # Ignore double-clicks on stretch tab
-        super().mouseDoubleClickEvent(event)
-
+        <h3>Keyboard Shortcuts</h3>
+        <p><b>Ctrl+O:</b> Add File</p>
+        <p><b>Ctrl+Shift+O:</b> Add Folder</p>
+        <p><b>Remove:</b> Remove selected files</p>
+        <p><b>Ctrl+Shift+D:</b> Clear all files</p>
+        <p><b>Ctrl+Q:</b> Exit application</p>
+        <p><b>F1:</b> Show this documentation</p>
+        </div>
+        """
 
-class PDFConverterApp(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("PDF Utility App")
-        self.setWindowIcon(QIcon(get_resource_path("gui/icons/tools.svg")))
+        self.setWindowIcon(_icon("gui/icons/tools.svg"))
         self.resize(1000, 700)
 
+        # Application-wide pool for short background jobs, drained on close
+        self.pool = QThreadPool.globalInstance()
+        self.pool.setMaxThreadCount(os.cpu_count() or 1)
+
+        # One stylesheet for the whole window, set before any children exist so each widget is polished once
+        self.setStyleSheet(_STYLE)
+
         # Initialize components
-        self.tabs_initialized = False
+        self._real_tabs = {}  # Tab index -> real tab, filled in as tabs are first selected
+        self._tabs_initialized = False
+        self._stoppers = []  # Callables that stop a built tab's worker, run on close
         self._initialize_ui_components()
 
         # Set up notification widget
         self.notification_widget = NotificationWidget(self)
+        # Re-center the notification once a burst of window resize events has been handled
+        self._notif_reposition_timer = QTimer(self, singleShot=True, interval=0)
+        self._notif_reposition_timer.timeout.connect(self.notification_widget.reposition)
+        self._toast_key = None  # (correlation_id, level) of the last toast, None if not coalescable
+        self._toast_updated_at = 0.0
 
-        # Check for Ghostscript availability (non-blocking)
-        QTimer.singleShot(100, self._check_ghostscript)
+        # Help dialogs are built on first open and reused afterwards
+        self._about_box = None
+        self._doc_box = None
 
-    def show_notification(self, message: str, level: str = "info", duration: int = 4000):
-        """Show a toast notification."""
-        self.notification_widget.show_message(message, level, duration)
+        # Ghostscript is only probed once the Compress tab is first opened
+        self._ghostscript_probe = None
+
+    def show_notification(self, message: str, level: str = "info", duration: int = 4000, correlation_id: str = None):
+        """
+        Show a toast notification.
+        Notifications with the same correlation_id and level arriving within TOAST_COALESCE_SECONDS
+        of each other update the visible toast in place instead of fading in a new one.
+        """
+        now = time.monotonic()
+        toast_key = (correlation_id, level) if correlation_id else None
+        if (
+            toast_key is not None
+            and toast_key == self._toast_key
+            and now - self._toast_updated_at < TOAST_COALESCE_SECONDS
+            and self.notification_widget.is_showing()
+        ):
+            self.notification_widget.update_message(message, duration)
+        else:
+            self.notification_widget.show_message(message, level, duration)
+        self._toast_key = toast_key
+        self._toast_updated_at = now
 
     def _initialize_ui_components(self):
         """Initialize UI components that don't require heavy processing"""
@@ -170,73 +382,16 @@ class PDFConverterApp(QMainWindow):
         main_layout = QVBoxLayout(central)
         main_layout.setSpacing(2)
         main_layout.setContentsMargins(0, 0, 0, 0)
-        
-        # Create tab widget with custom tab bar
+
+        # Create tab widget
         self.tab_widget = QTabWidget()
         self.tab_widget.setTabPosition(QTabWidget.TabPosition.North)
         self.tab_widget.setDocumentMode(True)
-        
-        # Set custom tab bar with stretchable dummy tab
-        self.custom_tab_bar = StretchableTabBar()
-        self.tab_widget.setTabBar(self.custom_tab_bar)
-        
 
-
-        self.tab_widget.setStyleSheet(
-            """
-            QTabWidget {
-                background: #d6f0fa;
-                margin: 0px;
-                padding: 0px;
-            }
-            QTabWidget::pane {
-                border: 1px solid #b2e0f7;
-                background: #ffffff;
-                margin: 0px;
-                padding: 0px;
-            }
-            QTabBar {
-                background: #d6f0fa;
-                margin: 0px;
-                padding: 0px;
-                spacing: 0px;
-            }
-            QTabBar::tab {
-                background: #d6f0fa;
-                color: #000;
-                padding: 8px 16px;
-                border: 1px solid #b2e0f7;
-                border-bottom: none;
-            }
-            QTabBar::tab:selected {
-                background: #ffffff;
-                border-bottom: 1px solid #ffffff;
-                border-top: 1px solid #b2e0f7;
-            }
-            QTabBar::tab:hover {
-                background: #b7d6fb;
-            }
-            QTabBar::tab:selected:hover {
-                background: #ffffff;
-                border-bottom: 1px solid #b7d6fb;
-            }
-            QTabBar::tab:disabled {
-                background: #d6f0fa;
-                border: none;
-                color: transparent;
-            }
-            QTabBar::tab:disabled:hover {
-                background: #d6f0fa;
-                border: none;
-            }
-            QTabBar::scroller {
-                background: #d6f0fa;
-            }
-            QTabBar QToolButton {
-                background: #d6f0fa;
-            }
-        """
-        )
+        # Fill the rest of the tab row with an expanding corner widget
+        filler = QWidget()
+        filler.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
+        self.tab_widget.setCornerWidget(filler, Qt.Corner.TopRightCorner)
 
         # Add placeholder tabs
         self._add_placeholder_tabs()
@@ -244,154 +399,98 @@ class PDFConverterApp(QMainWindow):
         main_layout.addWidget(self.tab_widget)
         self.setCentralWidget(central)
 
-        # Apply main window and central widget background
-        self.setStyleSheet(
-            """
-            QMainWindow {                
-                background: #b2e0f7;
-                spacing: 0px;
-                margin: 0px;
-                padding: 0px;
-            }
-            QMainWindow::separator {
-                background: #b2e0f7;
-                width: 0px;
-                height: 0px;
-            }
-            QWidget {
-                background: #d6f0fa;
-            }
-        """
-        )
-
-        # Style menu bar and menu items
-        self.menuBar().setStyleSheet(
-            """
-            QMenuBar {
-                background: #b2e0f7;
-                color: #000;
-                font-size: 15px;
-                spacing: 0px;
-                margin: 0px;
-                padding: 0px;
-                border: none;
-                border-bottom: none;
-            }
-            QMenuBar::item {
-                background: #b2e0f7;
-                color: #000;
-                spacing: 0px;
-                margin: 0px;
-                padding: 4px 8px;
-            }
-            QMenuBar::item:selected {
-                background: #a2d4ec;
-                color: #000;
-            }
-            QMenu {
-                background: #b2e0f7;
-                color: #000;
-                font-size: 15px;
-            }
-            QMenu::item:selected {
-                background: #a2d4ec;
-                color: #000;
-            }
-        """
-        )
-
     def _add_placeholder_tabs(self):
         """Add placeholder tabs that will be replaced with real tabs"""
-        placeholder_tabs = [
-            ("Convert to DOCX", "gui/icons/file-text.svg"),
-            ("Compress PDF", "gui/icons/archive.svg"),
-            ("Merge PDFs", "gui/icons/layers.svg"),
-            ("Split PDF", "gui/icons/scissors.svg"),
-            ("Extract Text", "gui/icons/file-text.svg"),
-            ("Convert to Image", "gui/icons/image.svg"),
-        ]
-
-        for title, icon_path in placeholder_tabs:
+        for _, _, icon_path, title, _, _ in _TABS:
             placeholder = QWidget()
             placeholder_layout = QVBoxLayout(placeholder)
 
             # Add loading label
             loading_label = QLabel("Loading...")
+            loading_label.setTextFormat(Qt.TextFormat.PlainText)
+            loading_label.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
             loading_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            loading_label.setStyleSheet("font-size: 16px; color: #666; padding: 50px;")
+            loading_label.setObjectName("loadingLabel")
             placeholder_layout.addWidget(loading_label)
 
-            self.tab_widget.addTab(placeholder, QIcon(get_resource_path(icon_path)), title)
-        
-        # The stretch tab is automatically added by the custom tab bar
+            self.tab_widget.addTab(placeholder, _icon(icon_path), title)
 
-    def _initialize_real_tabs(self):
-        """Initialize the real tabs with all functionality"""
-        if self.tabs_initialized:
+    def _initialize_real_tabs(self, on_complete=None):
+        """Build the default tab; the others are built the first time they are selected"""
+        if self._tabs_initialized:
             return
+        self._tabs_initialized = True
 
-        # Create real tabs, passing the main window as the parent
-        self.convert_tab = ConvertTab(self)
-        self.compress_tab = CompressTab(self)
-        self.merge_tab = MergeTab(self)
-        self.split_tab = SplitTab(self)
-        self.extract_tab = ExtractTab(self)
-        self.convert_to_image_tab = ConvertToImageTab(self)
-
-        # Replace placeholder tabs with real tabs
-        # Note: The stretch tab is at the end, so we need to account for it
-        real_tab_count = 6  # Number of real tabs
-        
-        self.tab_widget.removeTab(0)  # Remove Convert to DOCX placeholder
-        self.tab_widget.insertTab(0, self.convert_tab, QIcon(get_resource_path("gui/icons/file-text.svg")), "Convert to DOCX")
+        # Connect tab change signal
+        self.tab_widget.currentChanged.connect(self._materialize_tab)
+        self.tab_widget.currentChanged.connect(self._update_start_button_text)
 
-        self.tab_widget.removeTab(1)  # Remove Compress PDF placeholder
-        self.tab_widget.insertTab(1, self.compress_tab, QIcon(get_resource_path("gui/icons/archive.svg")), "Compress PDF")
+        # Set the first tab (Convert to DOCX) as the default active tab
+        self.tab_widget.setCurrentIndex(0)
+        self._materialize_tab(0)
 
-        self.tab_widget.removeTab(2)  # Remove Merge PDFs placeholder
-        self.tab_widget.insertTab(2, self.merge_tab, QIcon(get_resource_path("gui/icons/layers.svg")), "Merge PDFs")
+        if on_complete:
+            on_complete()
 
-        self.tab_widget.removeTab(3)  # Remove Split PDF placeholder
-        self.tab_widget.insertTab(3, self.split_tab, QIcon(get_resource_path("gui/icons/scissors.svg")), "Split PDF")
+    def _materialize_tab(self, index):
+        """Replace the placeholder at index with its real tab if it hasn't been built yet"""
+        if index in self._real_tabs or not 0 <= index < len(_TABS):
+            return
 
-        self.tab_widget.removeTab(4)  # Remove Extract Text placeholder
-        self.tab_widget.insertTab(4, self.extract_tab, QIcon(get_resource_path("gui/icons/file-text.svg")), "Extract Text")
+        attr_name, class_name, icon_path, title, _, _ = _TABS[index]
 
-        self.tab_widget.removeTab(5)  # Remove Convert to Image placeholder
-        self.tab_widget.insertTab(
-            5, self.convert_to_image_tab, QIcon(get_resource_path("gui/icons/image.svg")), "Convert to Image"
-        )
-        
-        # Update the stretch tab index after all real tabs are added
-        self.custom_tab_bar.stretch_tab_index = real_tab_count
+        # Create the real tab, passing the main window as the parent
+        from gui import tabs
 
-        # Connect tab change signal
-        self.tab_widget.currentChanged.connect(self._update_start_button_text)
+        tab = getattr(tabs, class_name)(self)
+        setattr(self, attr_name, tab)
+        self._real_tabs[index] = tab
 
-        # Set initial button text for the default selected tab (Convert to DOCX)
-        self._update_start_button_text(0)
+        # Swap without signals so removing the current tab doesn't select (and build) a neighbour
+        placeholder = self.tab_widget.widget(index)
+        self.tab_widget.blockSignals(True)
+        self.tab_widget.removeTab(index)
+        self.tab_widget.insertTab(index, tab, _icon(icon_path), title)
+        self.tab_widget.setCurrentIndex(index)
+        self.tab_widget.blockSignals(False)
+        placeholder.deleteLater()
 
-        # Connect start button click for each tab
-        self.convert_tab.start_btn.clicked.connect(self._start_convert)
-        self.compress_tab.start_btn.clicked.connect(self._start_compress)
-        self.merge_tab.start_btn.clicked.connect(self._start_merge)
-        self.split_tab.start_btn.clicked.connect(self._start_split)
-        self.extract_tab.start_btn.clicked.connect(self._start_extract)
-        self.convert_to_image_tab.start_btn.clicked.connect(self._start_convert_to_image)
+        # Connect start button click for this tab
+        tab.start_btn.clicked.connect(self._start_current)
 
-        self.tabs_initialized = True
+        # Register how to stop this tab's worker on close; the workers' stop() is safe to call repeatedly
+        if hasattr(tab, "stop_active_conversion"):
+            self._stoppers.append(tab.stop_active_conversion)
+        else:
+            self._stoppers.append(lambda t=tab: t.worker and t.worker.stop())
 
-        # Set the first tab (Convert to DOCX) as the default active tab
-        self.tab_widget.setCurrentIndex(0)
+        self._update_start_button_text(index)
 
+        # Only compression needs Ghostscript, so don't probe for it before that tab is used
+        if attr_name == "compress_tab":
+            self._check_ghostscript()
 
+    def _current_real_tab(self):
+        """Return the current tab, building it first if it is still a placeholder"""
+        index = self.tab_widget.currentIndex()
+        self._materialize_tab(index)
+        return self._real_tabs.get(index)
 
     def _check_ghostscript(self):
         """Check for Ghostscript availability (non-blocking)"""
-        if not is_ghostscript_available():
+        # Keep a reference so the probe's signals outlive run() until the queued result is delivered
+        self._ghostscript_probe = GhostscriptProbe()
+        self._ghostscript_probe.signals.finished.connect(self._on_ghostscript_checked)
+        self.pool.start(self._ghostscript_probe)
+
+    def _on_ghostscript_checked(self, available):
+        """Warn the user if Ghostscript was not found"""
+        if not available:
             msg_box = QMessageBox(self)
             msg_box.setWindowTitle("Ghostscript Not Found")
-            msg_box.setText("Ghostscript is required for PDF compression features. Please ensure Ghostscript is installed on your system.")
+            msg_box.setText(
+                "Ghostscript is required for PDF compression features. Please ensure Ghostscript is installed on your system."
+            )
             msg_box.setIcon(QMessageBox.Icon.Warning)
             msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
             # Set the dialog text color to black and style the button
@@ -450,25 +549,6 @@ class PDFConverterApp(QMainWindow):
         exit_action.triggered.connect(self.close)
         file_menu.addAction(exit_action)
 
-        file_menu.setStyleSheet(
-            """
-            QMenu::item {
-                background: #b2e0f7;
-                color: #000000;
-                padding: 4px 8px;
-            }
-            QMenu::item:selected {
-                background: #a2d4ec;
-                color: #000000;
-            }
-            QMenu::separator {
-                background: #a2d4ec;
-                height: 1px;
-                margin: 2px 4px;
-            }
-        """
-        )
-
         # Add Edit menu items
         delete_action = QAction("Remove", self)
         delete_action.setShortcut("Delete")
@@ -480,19 +560,6 @@ class PDFConverterApp(QMainWindow):
         clear_all_action.triggered.connect(self._clear_all)
         edit_menu.addAction(clear_all_action)
 
-        edit_menu.setStyleSheet(
-            """
-            QMenu::item {
-                background: #b2e0f7;
-                color: #000000;
-            }
-            QMenu::item:selected {
-                background: #a2d4ec;
-                color: #000000;
-            }
-        """
-        )
-
         # Add Help menu items
         documentation_action = QAction("Documentation", self)
         documentation_action.setShortcut("F1")
@@ -505,19 +572,6 @@ class PDFConverterApp(QMainWindow):
         about_action.triggered.connect(self._show_about)
         help_menu.addAction(about_action)
 
-        help_menu.setStyleSheet(
-            """
-            QMenu::item {
-                background: #b2e0f7;
-                color: #000000;
-            }
-            QMenu::item:selected {
-                background: #a2d4ec;
-                color: #000000;
-            }
-        """
-        )
-
         menubar.addMenu(file_menu)
         menubar.addMenu(edit_menu)
         menubar.addMenu(help_menu)
@@ -527,295 +581,118 @@ class PDFConverterApp(QMainWindow):
         toolbar = QToolBar()
         toolbar.setMovable(False)
         toolbar.setIconSize(QSize(24, 24))
-        toolbar.setStyleSheet(
-            """
-            QToolBar {
-                background: #b2e0f7;
-                color: #000;
-                spacing: 0px;
-                margin: 0px;
-                padding: 2px;
-                border: none;
-                border-top: 1px solid #8fc7e6;
-                border-bottom: none;
-            }
-            QToolBar QWidget {
-                background: #b2e0f7;
-            }
-            QToolButton {
-                background: transparent;
-            }
-            QToolBar::separator {
-                background: #b2e0f7;
-                width: 2px;
-                margin: 0px;
-            }
-        """
-        )
         self.addToolBar(Qt.ToolBarArea.TopToolBarArea, toolbar)
 
         def add_toolbar_button(icon_path, text, callback):
             btn = QToolButton()
-            # Use the resource path function to get the correct icon path
-            full_icon_path = get_resource_path(icon_path)
-            btn.setIcon(QIcon(full_icon_path))
+            btn.setIcon(_icon(icon_path))
             btn.setText(text)
             btn.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
             btn.clicked.connect(callback)
-            btn.setStyleSheet("color: #000; font-size: 14px; padding: 2px 8px;")
             action = QWidgetAction(toolbar)
             action.setDefaultWidget(btn)
             toolbar.addAction(action)
             return btn
 
-        def add_separator():
-            line = QFrame()
-            line.setFrameShape(QFrame.Shape.VLine)
-            line.setFrameShadow(QFrame.Shadow.Sunken)
-            # Use a visible color for the separator
-            line.setStyleSheet("background: #8fc7e6; min-width: 2px; max-width: 2px; border: none; margin: 0px;")
-            sep_action = QWidgetAction(toolbar)
-            sep_action.setDefaultWidget(line)
-            toolbar.addAction(sep_action)
-
-        self.add_file_btn = add_toolbar_button("gui/icons/file-plus.svg", "Add File", self._add_file)
-        add_separator()
-        self.add_folder_btn = add_toolbar_button("gui/icons/folder-plus.svg", "Add Folder", self._add_folder)
-        add_separator()
-        self.delete_btn = add_toolbar_button("gui/icons/trash-2.svg", "Remove", self._delete_selected)
-        add_separator()
-        self.clear_btn = add_toolbar_button("gui/icons/x-circle.svg", "Clear All", self._clear_all)
-        add_separator()
+        for attr_name, icon_path, text, handler_name in _TOOLBAR_BUTTONS:
+            setattr(self, attr_name, add_toolbar_button(icon_path, text, getattr(self, handler_name)))
+            # Native separators are drawn by the style from the QToolBar::separator rule, no widget needed
+            toolbar.addSeparator()
 
     def _update_start_button_text(self, index):
         """Update the start button text based on the selected tab"""
-        if not self.tabs_initialized:
-            return
-
-        button_texts = {
-            0: "Convert",  # Convert to DOCX
-            1: "Compress",  # Compress PDF
-            2: "Merge",  # Merge PDFs
-            3: "Split",  # Split PDF
-            4: "Extract",  # Extract Text
-            5: "Convert",  # Convert to Image
-        }
-        current_tab = self.tab_widget.widget(index)
-        if current_tab and hasattr(current_tab, "start_btn"):
-            current_tab.start_btn.setText(button_texts.get(index, "Start"))
+        current_tab = self._real_tabs.get(index)
+        if current_tab is not None:
+            current_tab.start_btn.setText(_TABS[index][4])
 
     def _add_file(self):
-        if not self.tabs_initialized:
+        current_tab = self._current_real_tab()
+        if current_tab is None:
             return
         files, _ = QFileDialog.getOpenFileNames(self, "Select PDF Files", os.path.expanduser("~"), "PDF Files (*.pdf)")
         if files:
-            current_tab = self.tab_widget.currentWidget()
             if hasattr(current_tab, "add_files_to_table"):
                 current_tab.add_files_to_table(files)
 
     def _add_folder(self):
-        if not self.tabs_initialized:
+        current_tab = self._current_real_tab()
+        if current_tab is None:
             return
         folder = QFileDialog.getExistingDirectory(self, "Select Folder", os.path.expanduser("~"))
         if folder:
-            current_tab = self.tab_widget.currentWidget()
             if hasattr(current_tab, "add_files_to_table"):
-                pdf_files = []
-                for entry in os.listdir(folder):
-                    if entry.lower().endswith(".pdf"):
-                        file_path = os.path.join(folder, entry)
-                        pdf_files.append(file_path)
+                # scandir entries carry the joined path and their file type, so no extra stat calls are needed
+                with os.scandir(folder) as entries:
+                    pdf_files = [entry.path for entry in entries if _PDF_NAME.search(entry.name) and entry.is_file()]
                 if pdf_files:
                     current_tab.add_files_to_table(pdf_files)
 
     def _delete_selected(self):
-        if not self.tabs_initialized:
-            return
-        current_tab = self.tab_widget.currentWidget()
+        current_tab = self._current_real_tab()
         if hasattr(current_tab, "remove_selected_files"):
             current_tab.remove_selected_files()
 
     def _clear_all(self):
-        if not self.tabs_initialized:
-            return
-        current_tab = self.tab_widget.currentWidget()
+        current_tab = self._current_real_tab()
         if hasattr(current_tab, "clear_all_files"):
             current_tab.clear_all_files()
 
-    def _start_convert(self):
-        """Handle convert button click"""
-        if hasattr(self, "convert_tab"):
-            self.convert_tab._start_conversion_process()
-
-    def _start_compress(self):
-        """Handle compress button click"""
-        if hasattr(self, "compress_tab"):
-            self.compress_tab._start_compression()
-
-    def _start_merge(self):
-        """Handle merge button click"""
-        if hasattr(self, "merge_tab"):
-            self.merge_tab._start_merge()
-
-    def _start_split(self):
-        """Handle split button click"""
-        if hasattr(self, "split_tab"):
-            self.split_tab._start_split()
-
-    def _start_extract(self):
-        """Handle extract button click"""
-        if hasattr(self, "extract_tab"):
-            self.extract_tab._start_extract()
-
-    def _start_convert_to_image(self):
-        """Handle convert to image button click"""
-        if hasattr(self, "convert_to_image_tab"):
-            self.convert_to_image_tab._start_convert_to_image()
+    def _start_current(self):
+        """Handle start button click by dispatching to the current tab"""
+        index = self.tab_widget.currentIndex()
+        current_tab = self._real_tabs.get(index)
+        if current_tab is not None:
+            getattr(current_tab, _TABS[index][5])()
 
     def _show_about(self):
         """Show About dialog"""
-        current_version = get_version()
-        about_text = f"""
-        <div style="color: black;">
-        <h2>PDF Utilities</h2>
-        <p><b>Version:</b> {current_version}</p>
-        <p><b>Description:</b> A comprehensive PDF processing application built with PyQt6.</p>
-        <p><b>Features:</b></p>
-        <ul>
-            <li>Convert PDF to DOCX</li>
-            <li>Compress PDF files</li>
-            <li>Merge multiple PDFs</li>
-            <li>Split PDF pages</li>
-            <li>Extract text from PDFs</li>
-            <li>Convert PDF to images</li>
-        </ul>
-        <p><b>License:</b> GNU Affero General Public License v3.0 (AGPL-3.0)</p>
-        <p><b>Dependencies:</b> PyQt6, PyMuPDF, pdf2docx, Pillow, Ghostscript</p>
-        </div>
-        """
-        msg_box = QMessageBox(self)
-        msg_box.setWindowTitle("About PDF Utilities")
-        msg_box.setText(about_text)
-        msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
-        msg_box.setStyleSheet("QPushButton { color: black; }")
-        msg_box.exec()
+        if self._about_box is None:
+            self._about_box = self._create_info_box("About PDF Utilities", self._ABOUT_TEMPLATE.format(version=get_version()))
+        self._about_box.exec()
 
     def _show_documentation(self):
         """Show documentation dialog"""
-        doc_text = """
-        <div style="color: black;">
-        <h2>PDF Utilities Documentation</h2>
-        
-        <h3>Quick Start Guide</h3>
-        <p><b>1. Add Files:</b> Use "Add File" or "Add Folder" to select PDF files</p>
-        <p><b>2. Choose Operation:</b> Select the appropriate tab for your task</p>
-        <p><b>3. Configure Settings:</b> Adjust options as needed</p>
-        <p><b>4. Select Output:</b> Choose where to save results</p>
-        <p><b>5. Start Processing:</b> Click the action button</p>
-        
-        <h3>Features</h3>
-        <p><b>Convert to DOCX:</b> Convert PDF files to editable Word documents</p>
-        <p><b>Compress PDF:</b> Reduce file size with quality options</p>
-        <p><b>Merge PDFs:</b> Combine multiple PDFs into one file</p>
-        <p><b>Split PDF:</b> Extract specific pages or ranges</p>
-        <p><b>Extract Text:</b> Pull text content from PDFs</p>
-        <p><b>Convert to Image:</b> Export PDF pages as images</p>
-        
-        <h3>Keyboard Shortcuts</h3>
-        <p><b>Ctrl+O:</b> Add File</p>
-        <p><b>Ctrl+Shift+O:</b> Add Folder</p>
-        <p><b>Remove:</b> Remove selected files</p>
-        <p><b>Ctrl+Shift+D:</b> Clear all files</p>
-        <p><b>Ctrl+Q:</b> Exit application</p>
-        <p><b>F1:</b> Show this documentation</p>
-        </div>
-        """
+        if self._doc_box is None:
+            self._doc_box = self._create_info_box("Documentation", self._DOC_HTML)
+        self._doc_box.exec()
+
+    def _create_info_box(self, title, text):
+        """Create an OK-only message box that is kept and re-shown on later opens"""
         msg_box = QMessageBox(self)
-        msg_box.setWindowTitle("Documentation")
-        msg_box.setText(doc_text)
+        msg_box.setWindowTitle(title)
+        msg_box.setText(text)
         msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
         msg_box.setStyleSheet("QPushButton { color: black; }")
-        msg_box.exec()
+        return msg_box
 
     def resizeEvent(self, event):
         """Ensure notification widget is repositioned on window resize."""
         super().resizeEvent(event)
-        self.notification_widget.resizeEvent(event)
+        self._notif_reposition_timer.start()
 
     def closeEvent(self, event):
         # Stop any active workers
-        if hasattr(self, "convert_tab") and hasattr(self.convert_tab, "stop_active_conversion"):
-            self.convert_tab.stop_active_conversion()
-        if (
-            hasattr(self, "compress_tab")
-            and hasattr(self.compress_tab, "worker")
-            and self.compress_tab.worker
-            and self.compress_tab.worker.isRunning()
-        ):
-            self.compress_tab.worker.stop()
-        if (
-            hasattr(self, "merge_tab")
-            and hasattr(self.merge_tab, "worker")
-            and self.merge_tab.worker
-            and self.merge_tab.worker.isRunning()
-        ):
-            self.merge_tab.worker.stop()
-        if (
-            hasattr(self, "split_tab")
-            and hasattr(self.split_tab, "worker")
-            and self.split_tab.worker
-            and self.split_tab.worker.isRunning()
-        ):
-            self.split_tab.worker.stop()
-        if (
-            hasattr(self, "extract_tab")
-            and hasattr(self.extract_tab, "worker")
-            and self.extract_tab.worker
-            and self.extract_tab.worker.isRunning()
-        ):
-            self.extract_tab.worker.stop()
+        for stop in self._stoppers:
+            stop()
+        # Drop queued pool jobs and give running ones a moment to finish
+        self.pool.clear()
+        self.pool.waitForDone(3000)
+        # Building any tab loaded the workers module, which may have started processes for batch jobs
+        if self._real_tabs:
+            from workers import shutdown_process_pool
+
+            shutdown_process_pool()
         super().closeEvent(event)
 
 
 def create_splash_screen():
     """Create a beautiful splash screen"""
-    # Create a custom splash screen with gradient background
-    splash_pixmap = QPixmap(400, 300)
-    splash_pixmap.fill(QColor(214, 240, 250))  # Light blue background
-
-    # Create painter for custom drawing
-    painter = QPainter(splash_pixmap)
-    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-
-    # Draw gradient background
-    gradient = QColor(178, 224, 247)  # Lighter blue
-    painter.fillRect(0, 0, 400, 300, gradient)
-
-    # Draw title
-    title_font = QFont("Arial", 24, QFont.Weight.Bold)
-    painter.setFont(title_font)
-    painter.setPen(QColor(0, 0, 0))
-    painter.drawText(0, 80, 400, 40, Qt.AlignmentFlag.AlignCenter, "PDF Utilities")
-
-    # Draw subtitle - Updated to highlight key features
-    subtitle_font = QFont("Arial", 11)
-    painter.setFont(subtitle_font)
-    painter.setPen(QColor(100, 100, 100))
-    painter.drawText(0, 120, 400, 30, Qt.AlignmentFlag.AlignCenter, "Convert • Compress • Merge • Split • Extract")
-
-    # Draw version
-    version_font = QFont("Arial", 10)
-    painter.setFont(version_font)
-    painter.setPen(QColor(150, 150, 150))
-    painter.drawText(0, 150, 400, 20, Qt.AlignmentFlag.AlignCenter, "All-in-One PDF Solution")
-
-    # Draw loading text
-    loading_font = QFont("Arial", 11)
-    painter.setFont(loading_font)
-    painter.setPen(QColor(80, 80, 80))
-    painter.drawText(0, 200, 400, 30, Qt.AlignmentFlag.AlignCenter, "Initializing...")
-
-    painter.end()
+    # The splash is pre-rendered by bake_splash.py so startup doesn't pay for font setup and text drawing
+    splash_pixmap = QPixmap(get_resource_path("gui/icons/splash.png"))
+    if splash_pixmap.isNull():
+        from bake_splash import render_splash_pixmap
+
+        splash_pixmap = render_splash_pixmap()
 
     # Create splash screen
     splash = QSplashScreen(splash_pixmap)
@@ -825,6 +702,8 @@ def create_splash_screen():
 
 
 if __name__ == "__main__":
+    # Let pool processes spawned by the workers start up correctly from a frozen executable
+    multiprocessing.freeze_support()
     app = QApplication(sys.argv)
 
     # Create and show splash screen
@@ -845,23 +724,21 @@ if __name__ == "__main__":
         splash.showMessage(message, Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignCenter, QColor(0, 0, 0))
         app.processEvents()
 
-    def on_initialization_complete():
-        """Handle initialization completion"""
-        # Initialize real tabs
-        window._initialize_real_tabs()
-
-        # Close splash screen and show main window
+    def show_main_window():
+        """Close splash screen and show main window"""
         splash.finish(window)
         window.show()
 
+    def on_initialization_complete():
+        """Handle initialization completion"""
+        # Build the default tab, then show the main window
+        window._initialize_real_tabs(on_complete=show_main_window)
+
     # Connect signals
     init_thread.progress_updated.connect(on_progress_update)
     init_thread.initialization_complete.connect(on_initialization_complete)
 
-    # Start initialization thread
+    # Start initialization thread; the main window is shown once it completes
     init_thread.start()
 
-    # Show main window after a short delay (for better UX)
-    QTimer.singleShot(500, lambda: window.show() if not window.isVisible() else None)
-
     sys.exit(app.exec())
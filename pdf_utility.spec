@@ -24,7 +24,8 @@ icon_files = [
     'gui/icons/archive.svg',
     'gui/icons/layers.svg',
     'gui/icons/scissors.svg',
-    'gui/icons/image.svg'
+    'gui/icons/image.svg',
+    'gui/icons/splash.png'
 ]
 
 # Add existing icon files to datas
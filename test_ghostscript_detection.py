@@ -7,6 +7,23 @@ import os
 import sys
 import shutil
 import subprocess
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def _path_executables():
+    """Map lowercase file names on PATH to their full path, first PATH entry wins."""
+    executables = {}
+    for directory in os.environ.get("PATH", "").split(os.pathsep):
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                executables.setdefault(entry.name.lower(), entry.path)
+    return executables
+
 
 def test_ghostscript_detection():
     """Test Ghostscript detection functionality."""
@@ -16,8 +33,9 @@ def test_ghostscript_detection():
     
     if os.name == "nt":
         print("\n--- Windows Detection ---")
-        gs64 = shutil.which("gswin64c")
-        gs32 = shutil.which("gswin32c")
+        # One PATH scan serves both lookups instead of a full walk per name
+        gs64 = _path_executables().get("gswin64c.exe")
+        gs32 = _path_executables().get("gswin32c.exe")
         print(f"System gswin64c: {gs64}")
         print(f"System gswin32c: {gs32}")
         
@@ -5,25 +5,24 @@ Handles version reading from multiple sources for both development and standalon
 
 import os
 import sys
+import tomllib
+from functools import lru_cache
 from pathlib import Path
 
 
+@lru_cache(maxsize=1)
 def get_version():
-    """Get the current version of the application"""
+    """Get the current version of the application (read once per session)"""
     try:
         # Try to read from pyproject.toml first (development mode)
-        import toml
         try:
-            with open("pyproject.toml", "r", encoding="utf-8") as f:
-                data = toml.load(f)
+            with open("pyproject.toml", "rb") as f:
+                data = tomllib.load(f)
                 return data["tool"]["poetry"]["version"]
-        except (FileNotFoundError, KeyError, toml.TomlDecodeError):
+        except (FileNotFoundError, KeyError, tomllib.TOMLDecodeError):
             pass
 
         # Try to read from version.txt (production mode)
-        import sys
-        import os
-
         # Determine the base path for the executable
         if getattr(sys, "frozen", False):
             # Running as compiled executable
@@ -96,14 +95,13 @@ def _get_build_version():
 def _get_pyproject_version():
     """Get version from pyproject.toml (development mode)"""
     try:
-        import toml
         # Get the directory containing main.py
         current_dir = Path(__file__).parent
         pyproject_path = current_dir / "pyproject.toml"
         
         if pyproject_path.exists():
-            with open(pyproject_path, 'r', encoding='utf-8') as f:
-                data = toml.load(f)
+            with open(pyproject_path, 'rb') as f:
+                data = tomllib.load(f)
                 return data.get('project', {}).get('version', '0.0.0')
     except Exception:
         pass